@@ -0,0 +1,134 @@
+"""
+Admission control for expensive calls (model inference, translator).
+
+A gate allows at most `slots` callers in at once. A caller waits at most
+`budget_ms` for a slot; after that it is turned away and should fall back to
+a cheaper path instead of queueing indefinitely.
+
+    with inference_gate.slot() as admitted:
+        if admitted:
+            result = bot.get_reply(text)
+    if not admitted:
+        ...  # degrade
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# Reply sent when a request is shed (no slot and no cheap answer)
+BUSY_MESSAGE = (
+    "We're receiving a lot of questions right now. "
+    "Please try again in a moment."
+)
+
+
+class AdmissionGate:
+    """Bounded worker slots with a queue-time budget."""
+
+    def __init__(self, name: str, slots: int, budget_ms: float):
+        self.name = name
+        self.slots = slots
+        self.budget_ms = budget_ms
+        self._sem = threading.BoundedSemaphore(slots)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+
+    @contextmanager
+    def slot(self):
+        """Yield True if a slot was obtained within the budget, else False."""
+        start = time.perf_counter()
+        admitted = self._sem.acquire(timeout=self.budget_ms / 1000.0)
+        waited_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._wait_total_ms += waited_ms
+            self._wait_max_ms = max(self._wait_max_ms, waited_ms)
+            if admitted:
+                self._admitted += 1
+                self._in_flight += 1
+            else:
+                self._rejected += 1
+
+        if not admitted:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._sem.release()
+
+    @contextmanager
+    def background_slot(self):
+        """
+        Block until a slot is free, for background work (e.g. loading a
+        tenant). It shows in in_flight but not in the admitted / rejected /
+        wait numbers, which describe requests.
+        """
+        self._sem.acquire()
+        with self._lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._sem.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self._admitted + self._rejected
+            return {
+                "slots": self.slots,
+                "budget_ms": self.budget_ms,
+                "in_flight": self._in_flight,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._wait_total_ms / total, 2) if total else 0.0,
+                "max_wait_ms": round(self._wait_max_ms, 2),
+            }
+
+
+class AnswerCache:
+    """Small thread-safe LRU of recent bot replies keyed by normalised text."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def get(self, text: str):
+        key = self._key(text)
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, text: str, value):
+        key = self._key(text)
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
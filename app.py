@@ -1,17 +1,118 @@
-from flask import Flask, render_template, request, jsonify
-from chatbot.model import CollegeChatbot
+from flask import Flask, render_template, request, jsonify, abort, g, has_request_context
 from chatbot.small_talk import handle_small_talk
+from chatbot.lang_detect import needs_translation
+from chatbot.admission import AdmissionGate, BUSY_MESSAGE
+from chatbot.profiling import ProfileRing
+from chatbot.tenants import TenantRegistry, TenantUnavailable, load_tenant_configs
+from chatbot.traffic_capture import StageTimer, TrafficRecorder
 from deep_translator import GoogleTranslator  # translation
 from difflib import SequenceMatcher          # NEW: fuzzy matching
 import re                                    # NEW: for splitting words
+import threading
+import os
+import random
+import time
+import functools
+import hmac
 
 app = Flask(__name__)
 
 FAQ_FILE = "data/faq_data.json"
-bot = CollegeChatbot(FAQ_FILE)
+
+# ------------ TENANTS (one deployment, several colleges/campuses) ------------
+# Each tenant has its own FAQ + course/fee tables; all share one encoder.
+# Tenants load on first use and idle ones are evicted over the budget.
+
+TENANTS_FILE = "data/tenants.json"
+DEFAULT_TENANT = "dsu"
+TENANT_MEMORY_BUDGET_MB = 512
+
+# ------------ ADMISSION CONTROL (overload protection) ------------
+# At most N concurrent model / translator calls. A request that cannot get a
+# slot within the budget degrades to a cheaper path instead of queueing.
+
+INFERENCE_WORKERS = 4
+INFERENCE_QUEUE_BUDGET_MS = 300
+TRANSLATOR_WORKERS = 8
+TRANSLATOR_QUEUE_BUDGET_MS = 200
+
+inference_gate = AdmissionGate("inference", INFERENCE_WORKERS, INFERENCE_QUEUE_BUDGET_MS)
+translator_gate = AdmissionGate("translator", TRANSLATOR_WORKERS, TRANSLATOR_QUEUE_BUDGET_MS)
+
+# ------------ ON-DEMAND PROFILING ------------
+# A /chat request is profiled when it carries the admin token in the
+# X-Profile header, or at random with PROFILE_SAMPLE_RATE (0 = off).
+# Profiles are listed at /admin/profiles; the admin token is read only from
+# the X-Admin-Token header or the admin_token cookie (never the URL).
+
+ADMIN_TOKEN = os.environ.get("CHATBOT_ADMIN_TOKEN", "")
+PROFILE_SAMPLE_RATE = float(os.environ.get("CHATBOT_PROFILE_SAMPLE_RATE", "0"))
+PROFILE_DIR = "profiles"
+PROFILE_MAX_ENTRIES = 100
+
+profile_ring = ProfileRing(PROFILE_DIR, max_entries=PROFILE_MAX_ENTRIES)
+
+# ------------ TRAFFIC CAPTURE (input for replay.py) ------------
+# A sampled share of /chat requests is logged with per-stage timings.
+# Off unless CHATBOT_CAPTURE_SAMPLE_RATE is set (e.g. 0.05 = 5%).
+
+CAPTURE_FILE = os.environ.get("CHATBOT_CAPTURE_FILE", "captures/traffic.jsonl")
+CAPTURE_SAMPLE_RATE = float(os.environ.get("CHATBOT_CAPTURE_SAMPLE_RATE", "0"))
+CAPTURE_MAX_MB = 50
+
+traffic_recorder = TrafficRecorder(
+    CAPTURE_FILE, CAPTURE_SAMPLE_RATE, max_bytes=CAPTURE_MAX_MB * 1024 * 1024
+)
+
+
+def timed_stage(name: str):
+    """Add the wrapped call's time to the current request's stage timings."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            timer = g.get("stage_timer") if has_request_context() else None
+            if timer is None:
+                return fn(*args, **kwargs)
+            with timer.stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ------------ RUNTIME COUNTERS (served at /stats) ------------
+
+STATS = {
+    "translate_in_calls": 0,      # messages sent to the translator
+    "translate_in_skipped": 0,    # English messages that skipped it
+    "answer_cache_hits": 0,       # FAQ replies served from the answer cache
+    "degraded_translate_in": 0,   # translator busy → matched the raw message
+    "degraded_translate_out": 0,  # translator busy → replied in English
+    "degraded_fuzzy": 0,          # model busy → answered by _fuzzy_spell_fix
+    "shed": 0,                    # model busy and no cheap answer → busy reply
+    "tenant_loading": 0,          # college still loading → "try again" reply
+    "tenant_unavailable": 0,      # college failed to load → error reply
+}
+_stats_lock = threading.Lock()
+
+
+def count_stat(name: str, n: int = 1):
+    with _stats_lock:
+        STATS[name] = STATS.get(name, 0) + n
+
+
+def count_degraded(name: str):
+    """
+    count_stat() for a shed/degraded reply; also lists it in the response's
+    X-Degraded header so clients (loadtest.py) can tell it from a full answer.
+    """
+    count_stat(name)
+    if has_request_context():
+        g.setdefault("degraded", []).append(name)
 
 # ------------ COURSES: SCHOOLS + ANSWERS ------------
 
+COURSE_MENU_PROMPT = "Here are the schools at DSU. Please choose one option:\n"
+
 COURSE_SCHOOL_OPTIONS = [
     {"number": 1, "question": "School of Engineering"},
     {"number": 2, "question": "School of Computer Applications"},
@@ -132,6 +233,7 @@ def has_approx_word(text: str, targets, threshold: float = 0.8) -> bool:
     return False
 
 
+@timed_stage("intent")
 def is_courses_query(text: str) -> bool:
     """
     Detect queries asking about courses/branches/schools,
@@ -177,6 +279,8 @@ def is_courses_query(text: str) -> bool:
 
 # ---------- FEE OPTIONS ----------
 
+FEE_MENU_PROMPT = "I found more than one thing related to that. Please choose one option:"
+
 FEE_OPTIONS = [
     {"number": 1, "question": "College tuition fee structure"},
     {"number": 2, "question": "Hostel fee structure"},
@@ -214,46 +318,88 @@ FEE_ANSWERS = {
     ),
 }
 
-def detect_fee_ambiguity(text: str):
+@timed_stage("intent")
+def detect_fee_ambiguity(text: str, fee_options=FEE_OPTIONS):
     """
     Detects when the user is asking something fee-related,
     including spelling mistakes like 'fee strcture', 'fess', etc.
+    Returns `fee_options` (the college's fee menu) if so.
     """
     t = text.lower()
 
     # direct phrase
     if "fee structure" in t or "fees structure" in t:
-        return FEE_OPTIONS
+        return fee_options
 
     # fuzzy detection of fee-related words
     if has_approx_word(t, ["fee", "fees", "fess", "feee", "feez"]):
-        return FEE_OPTIONS
+        return fee_options
 
     return None
 
 
 # ----------------- TRANSLATION HELPERS ----------------- #
 
+@timed_stage("translate_in")
 def translate_to_english(text: str) -> str:
-    """Translate any input text to English (for internal processing)."""
-    try:
-        return GoogleTranslator(source="auto", target="en").translate(text)
-    except Exception:
+    """
+    Translate any input text to English (for internal processing).
+    English input (detected locally) skips the translator round trip.
+    """
+    if not needs_translation(text):
+        count_stat("translate_in_skipped")
         return text
 
+    with translator_gate.slot() as admitted:
+        if admitted:
+            count_stat("translate_in_calls")
+            try:
+                return GoogleTranslator(source="auto", target="en").translate(text)
+            except Exception:
+                return text
+
+    count_degraded("degraded_translate_in")
+    return text
+
+
+@timed_stage("translate_out")
+def translate_reply(text: str, options, target_lang: str):
+    """
+    Translate a reply and its option labels into the user's chosen language
+    using ONE translator slot for the whole response.
+
+    options: list of {"number", "question"} dicts in English (may be empty)
+
+    Returns (text, options). If target_lang is empty, the slot is refused
+    or any translation fails, everything comes back in English, so a menu
+    is never half translated.
+    """
+    options = list(options or [])
+    target_lang = (target_lang or "").strip().lower()
+    if not target_lang:
+        return text, options
+
+    with translator_gate.slot() as admitted:
+        if admitted:
+            try:
+                translator = GoogleTranslator(source="en", target=target_lang)
+                return translator.translate(text), [
+                    {"number": opt["number"], "question": translator.translate(opt["question"])}
+                    for opt in options
+                ]
+            except Exception:
+                return text, options
+
+    count_degraded("degraded_translate_out")
+    return text, options
+
 
 def maybe_translate_from_english(text: str, target_lang: str) -> str:
     """
     Translate English output text into the user's chosen language.
     If target_lang is empty or translation fails, return English text.
     """
-    target_lang = (target_lang or "").strip().lower()
-    if not target_lang:
-        return text
-    try:
-        return GoogleTranslator(source="en", target=target_lang).translate(text)
-    except Exception:
-        return text
+    return translate_reply(text, [], target_lang)[0]
 
 
 def handle_translate_command(text: str):
@@ -277,33 +423,326 @@ def handle_translate_command(text: str):
         if not content:
             return "Please provide some text to translate after the colon (:)."
 
-        try:
-            translated = GoogleTranslator(
-                source="auto",
-                target=lang_part
-            ).translate(content)
-            return translated
-        except Exception:
-            return (
-                f"Sorry, I couldn't translate to '{lang_part}'. "
-                "Please check the language name (e.g., 'kannada', 'hindi', 'french')."
-            )
+        with translator_gate.slot() as admitted:
+            if not admitted:
+                count_degraded("shed")
+                return BUSY_MESSAGE
+            try:
+                translated = GoogleTranslator(
+                    source="auto",
+                    target=lang_part
+                ).translate(content)
+                return translated
+            except Exception:
+                return (
+                    f"Sorry, I couldn't translate to '{lang_part}'. "
+                    "Please check the language name (e.g., 'kannada', 'hindi', 'french')."
+                )
 
     return None
 
 
+# ----------------- TENANT REGISTRY ----------------- #
+
+tenants = TenantRegistry(
+    load_tenant_configs(TENANTS_FILE, DEFAULT_TENANT, FAQ_FILE),
+    default_tables={
+        "course_menu_prompt": COURSE_MENU_PROMPT,
+        "course_school_options": COURSE_SCHOOL_OPTIONS,
+        "course_school_answers": COURSE_SCHOOL_ANSWERS,
+        "fee_menu_prompt": FEE_MENU_PROMPT,
+        "fee_options": FEE_OPTIONS,
+        "fee_answers": FEE_ANSWERS,
+    },
+    memory_budget_bytes=TENANT_MEMORY_BUDGET_MB * 1024 * 1024,
+    pinned=[DEFAULT_TENANT],
+    load_slot=inference_gate.background_slot,  # encoding a corpus counts as inference
+)
+tenants.get(DEFAULT_TENANT)  # warm up the default college at startup
+
+TENANT_LOADING_MESSAGE = (
+    "This college's information is being loaded. "
+    "Please try again in a few seconds."
+)
+TENANT_LOADING_RETRY_AFTER = 5  # seconds
+
+TENANT_UNAVAILABLE_MESSAGE = (
+    "Sorry, this college's information could not be loaded. "
+    "Please try again later."
+)
+
+
+def request_tenant_id(data=None):
+    """
+    Tenant from the JSON body or ?tenant=, else the default college.
+    Returns None for a malformed id (e.g. a number), which no tenant matches.
+    """
+    tenant_id = (data or {}).get("tenant") or request.args.get("tenant") or ""
+    if not isinstance(tenant_id, str):
+        return None
+    return tenant_id.strip().lower() or DEFAULT_TENANT
+
+
+# ----------------- STATIC MENUS FOR THE CLIENT ----------------- #
+# /bootstrap sends every static menu (course schools, fee options) and its
+# answers in one payload, so script.js can answer option clicks locally.
+# tenant.bootstrap_version changes whenever the tables change, so the
+# versioned payload is safe to cache for a long time.
+
+_bootstrap_lock = threading.Lock()
+
+
+def _translate_strict(text: str, target_lang: str) -> str:
+    """Like maybe_translate_from_english, but raises instead of falling back."""
+    if not target_lang:
+        return text
+    with translator_gate.slot() as admitted:
+        if not admitted:
+            raise RuntimeError("translator busy")
+        return GoogleTranslator(source="en", target=target_lang).translate(text)
+
+
+def build_bootstrap(tenant, lang: str) -> dict:
+    """
+    All static menus and answers of `tenant` in `lang`. Only fully
+    translated payloads are cached; if the translator fails the caller gets
+    an exception.
+    """
+    with _bootstrap_lock:
+        if lang in tenant.bootstrap_cache:
+            return tenant.bootstrap_cache[lang]
+
+    menus = {}
+    for topic, menu in tenant.static_menus().items():
+        menus[topic] = {
+            "prompt": _translate_strict(menu["prompt"], lang),
+            "options": [
+                {"number": opt["number"], "question": _translate_strict(opt["question"], lang)}
+                for opt in menu["options"]
+            ],
+            "answers": {
+                str(n): _translate_strict(text, lang)
+                for n, text in menu["answers"].items()
+            },
+        }
+
+    payload = {
+        "version": tenant.bootstrap_version,
+        "tenant": tenant.id,
+        "lang": lang,
+        "menus": menus,
+    }
+    with _bootstrap_lock:
+        tenant.bootstrap_cache[lang] = payload
+    return payload
+
+
+# ----------------- FAQ MATCHING UNDER LOAD ----------------- #
+
+@timed_stage("match")
+def get_reply_with_admission(tenant, text: str):
+    """
+    tenant.bot.get_reply() behind the inference gate.
+
+    Returns (result, degraded). When no model slot frees up within the
+    budget, falls back to the answer cache, then to the cheap fuzzy matcher,
+    and finally to a "busy" reply. Degraded replies should be sent in
+    English so they don't wait on the translator either.
+    """
+    bot = tenant.bot
+    cached = tenant.answer_cache.get(text)
+    if cached is not None:
+        count_stat("answer_cache_hits")
+        return cached, False
+
+    with inference_gate.slot() as admitted:
+        if admitted:
+            result = bot.get_reply(text)
+            tenant.answer_cache.put(text, result)
+            return result, False
+
+    fuzzy_idx = bot._fuzzy_spell_fix(text)
+    if fuzzy_idx is not None:
+        count_degraded("degraded_fuzzy")
+        return {
+            "type": "answer",
+            "text": bot.answers[fuzzy_idx],
+            "index": fuzzy_idx,
+            "score": None,
+        }, True
+
+    count_degraded("shed")
+    return {"type": "answer", "text": BUSY_MESSAGE, "index": None, "score": None}, True
+
+
 @app.route("/")
 def index():
-    return render_template("index.html")
+    tenant_id = request_tenant_id()
+    try:
+        tenant = tenants.get_nowait(tenant_id)
+    except KeyError:
+        abort(404)
+    except TenantUnavailable:
+        tenant = None
+    # Still loading: the page works, bootstrap is fetched unversioned
+    return render_template(
+        "index.html",
+        bootstrap_version=tenant.bootstrap_version if tenant else "",
+        tenant=tenant_id,
+    )
+
+
+@app.route("/bootstrap")
+def bootstrap():
+    lang = (request.args.get("lang") or "").strip().lower()
+    version = request.args.get("v") or ""
+    try:
+        tenant = tenants.get_nowait(request_tenant_id())
+    except KeyError:
+        abort(404)
+    except TenantUnavailable as exc:
+        return jsonify({"error": "unavailable"}), 500, {"Retry-After": str(int(exc.retry_after) + 1)}
+    if tenant is None:
+        return jsonify({"error": "loading"}), 503, {"Retry-After": str(TENANT_LOADING_RETRY_AFTER)}
+
+    try:
+        payload = build_bootstrap(tenant, lang)
+        translated = True
+    except Exception:
+        # Translator unavailable: serve English, but don't let it be cached
+        payload = build_bootstrap(tenant, "")
+        translated = False
+
+    response = jsonify(payload)
+    if not translated:
+        response.headers["Cache-Control"] = "no-store"
+        return response
+
+    response.set_etag(f"{tenant.bootstrap_version}-{tenant.id}-{lang or 'en'}")
+    if version == tenant.bootstrap_version:
+        # Versioned URL: content can never change under it
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    else:
+        response.headers["Cache-Control"] = "public, max-age=300"
+    return response.make_conditional(request)
+
+
+@app.route("/stats")
+def stats():
+    with _stats_lock:
+        counters = dict(STATS)
+    return jsonify({
+        **counters,
+        "inference": inference_gate.stats(),
+        "translator": translator_gate.stats(),
+        "tenants": tenants.stats(),
+        "traffic_captured": traffic_recorder.recorded,
+    })
+
+
+def _is_admin_token(token: str) -> bool:
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(
+        (token or "").encode("utf-8"), ADMIN_TOKEN.encode("utf-8")
+    )
+
+
+def is_admin_request() -> bool:
+    token = request.headers.get("X-Admin-Token") or request.cookies.get("admin_token") or ""
+    return _is_admin_token(token)
+
+
+def should_profile_request() -> bool:
+    if _is_admin_token(request.headers.get("X-Profile") or ""):
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+@app.route("/admin/profiles")
+def admin_profiles():
+    if not is_admin_request():
+        abort(403)
+    return render_template("profiles.html", entries=profile_ring.slowest())
+
+
+@app.route("/admin/profiles/<entry_id>")
+def admin_profile(entry_id):
+    if not is_admin_request():
+        abort(403)
+    report = profile_ring.report(entry_id)
+    if report is None:
+        abort(404)
+    return report, 200, {"Content-Type": "text/plain; charset=utf-8"}
 
 
 @app.route("/chat", methods=["POST"])
 def chat():
+    g.stage_timer = StageTimer()
+    start = time.perf_counter()
+    data = request.get_json(force=True, silent=True) or {}
+
+    if should_profile_request():
+        meta = {
+            "message": (data.get("message") or "")[:200],
+            "topic": data.get("topic") or "",
+            "lang": data.get("lang") or "",
+        }
+        with profile_ring.capture("/chat", meta):
+            response = app.make_response(handle_chat())
+    else:
+        response = app.make_response(handle_chat())
+
+    if g.get("degraded"):
+        response.headers["X-Degraded"] = ",".join(g.degraded)
+
+    if traffic_recorder.should_sample():
+        body = response.get_json(silent=True) or {}
+        traffic_recorder.record({
+            "ts": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "tenant": request_tenant_id(data),
+            "message": data.get("message") or "",
+            "topic": data.get("topic") or "",
+            "lang": data.get("lang") or "",
+            "total_ms": round((time.perf_counter() - start) * 1000, 3),
+            "stages": g.stage_timer.as_dict(),
+            "status": response.status_code,
+            "clarify": bool(body.get("clarify")),
+            "clarify_topic": body.get("clarify_topic") or "",
+        })
+    return response
+
+
+def handle_chat():
     data = request.get_json(force=True)
     user_msg = (data.get("message") or "").strip()
     topic = (data.get("topic") or "").strip().lower()
     lang = (data.get("lang") or "").strip().lower()  # user-selected language
 
+    try:
+        tenant = tenants.get_nowait(request_tenant_id(data))
+    except KeyError:
+        return jsonify({
+            "reply": "Sorry, this college is not configured on the chatbot.",
+            "clarify": False,
+            "options": []
+        }), 404
+    except TenantUnavailable as exc:
+        # Last load failed: report it instead of "loading" until the backoff ends
+        count_stat("tenant_unavailable")
+        return jsonify({
+            "reply": TENANT_UNAVAILABLE_MESSAGE,
+            "clarify": False,
+            "options": []
+        }), 500, {"Retry-After": str(int(exc.retry_after) + 1)}
+
+    if tenant is None:
+        # First request for this college: it loads in the background
+        count_stat("tenant_loading")
+        return jsonify({
+            "reply": TENANT_LOADING_MESSAGE,
+            "clarify": False,
+            "options": []
+        }), 503, {"Retry-After": str(TENANT_LOADING_RETRY_AFTER)}
+
     if not user_msg:
         return jsonify({
             "reply": "Please type something so I can help you.",
@@ -332,8 +771,8 @@ def chat():
     # 3) Number reply for COURSES
     if topic == "courses" and user_msg.isdigit():
         n = int(user_msg)
-        if n in COURSE_SCHOOL_ANSWERS:
-            base = COURSE_SCHOOL_ANSWERS[n]
+        if n in tenant.course_school_answers:
+            base = tenant.course_school_answers[n]
             reply_text = maybe_translate_from_english(base, lang)
             return jsonify({
                 "reply": reply_text,
@@ -344,8 +783,8 @@ def chat():
     # 4) Number reply for FEE OPTIONS
     if topic == "fee" and user_msg.isdigit():
         n = int(user_msg)
-        if n in FEE_ANSWERS:
-            base = FEE_ANSWERS[n]
+        if n in tenant.fee_answers:
+            base = tenant.fee_answers[n]
             reply_text = maybe_translate_from_english(base, lang)
             return jsonify({
                 "reply": reply_text,
@@ -356,8 +795,8 @@ def chat():
     # 5) Number reply for ambiguous FAQ options (NEW)
     if topic == "faq" and user_msg.isdigit():
         idx = int(user_msg)
-        if 0 <= idx < len(bot.answers):
-            base = bot.answers[idx]
+        if 0 <= idx < len(tenant.bot.answers):
+            base = tenant.bot.answers[idx]
             reply_text = maybe_translate_from_english(base, lang)
             return jsonify({
                 "reply": reply_text,
@@ -367,19 +806,12 @@ def chat():
 
     # 6) Courses query → show schools options
     if is_courses_query(processed_msg):
-        lines = ["Here are the schools at DSU. Please choose one option:\n"]
-        for opt in COURSE_SCHOOL_OPTIONS:
+        lines = [tenant.course_menu_prompt]
+        for opt in tenant.course_school_options:
             lines.append(f"{opt['number']}. {opt['question']}")
-        reply_text = "\n".join(lines)
-        reply_text = maybe_translate_from_english(reply_text, lang)
-
-        translated_options = [
-            {
-                "number": opt["number"],
-                "question": maybe_translate_from_english(opt["question"], lang)
-            }
-            for opt in COURSE_SCHOOL_OPTIONS
-        ]
+        reply_text, translated_options = translate_reply(
+            "\n".join(lines), tenant.course_school_options, lang
+        )
 
         return jsonify({
             "reply": reply_text,
@@ -389,21 +821,12 @@ def chat():
         })
 
     # 7) Fee ambiguity → show fee options
-    fee_opts = detect_fee_ambiguity(processed_msg)
+    fee_opts = detect_fee_ambiguity(processed_msg, tenant.fee_options)
     if fee_opts:
-        base_lines = ["I found more than one thing related to that. Please choose one option:"]
+        base_lines = [tenant.fee_menu_prompt]
         for opt in fee_opts:
             base_lines.append(f"{opt['number']}. {opt['question']}")
-        reply = "\n".join(base_lines)
-        reply = maybe_translate_from_english(reply, lang)
-
-        translated_options = [
-            {
-                "number": opt["number"],
-                "question": maybe_translate_from_english(opt["question"], lang)
-            }
-            for opt in fee_opts
-        ]
+        reply, translated_options = translate_reply("\n".join(base_lines), fee_opts, lang)
 
         return jsonify({
             "reply": reply,
@@ -413,7 +836,9 @@ def chat():
         })
 
     # 8) Default FAQ-based answer *with ambiguity options* (NEW)
-    result = bot.get_reply(processed_msg)
+    result, degraded = get_reply_with_admission(tenant, processed_msg)
+    if degraded:
+        lang = ""  # overloaded: reply in English, skip the translator
 
     # a) Simple answer
     if result["type"] == "answer":
@@ -427,23 +852,18 @@ def chat():
 
     # b) Ambiguous → send FAQ options for user to choose
     if result["type"] == "clarify":
-        # result["options"] is a list of dicts: {index, score, question, answer}
+        # result["options"] is a list of dicts: {index, score, question}
         options = result["options"]
 
         base_lines = ["I found multiple similar questions. Please choose one:"]
         for opt in options:
             base_lines.append(f"{opt['index']}. {opt['question']}")
-        reply_text = "\n".join(base_lines)
-        reply_text = maybe_translate_from_english(reply_text, lang)
-
         # Build options array for frontend (number = global FAQ index)
-        api_options = [
-            {
-                "number": opt["index"],
-                "question": maybe_translate_from_english(opt["question"], lang)
-            }
-            for opt in options
-        ]
+        reply_text, api_options = translate_reply(
+            "\n".join(base_lines),
+            [{"number": opt["index"], "question": opt["question"]} for opt in options],
+            lang,
+        )
 
         return jsonify({
             "reply": reply_text,
@@ -0,0 +1,197 @@
+"""
+Packed, memory-mapped FAQ store.
+
+The JSON FAQ file is parsed into Python objects and every string lives in
+memory for the lifetime of the process (in every worker). The packed format
+keeps all questions and answers in one UTF-8 blob that is memory-mapped, so
+the OS shares the pages between processes and a string is only decoded when
+it is actually used.
+
+File layout (little-endian):
+
+    header  : b"FAQS" | version (u32) | count (u32)
+    table   : count x (question_offset, question_length,
+                       answer_offset, answer_length)   -- u32 each
+    blob    : UTF-8 bytes of all questions and answers
+
+Usage:
+    python chatbot/faq_store.py build data/faq_data.json data/faq_data.bin
+    python chatbot/faq_store.py bench data/faq_data.json data/faq_data.bin
+"""
+
+import json
+import mmap
+import struct
+import subprocess
+import sys
+import time
+from array import array
+from collections.abc import Sequence
+
+MAGIC = b"FAQS"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+FIELDS_PER_ITEM = 4  # question offset/length, answer offset/length
+
+
+def build_faq_store(json_path: str, out_path: str) -> int:
+    """Convert faq_data.json into the packed format. Returns the item count."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        faq_data = json.load(f)
+
+    table = array("I")
+    blob = bytearray()
+    for item in faq_data:
+        for text in (item["question"], item["answer"]):
+            encoded = text.encode("utf-8")
+            table.append(len(blob))
+            table.append(len(encoded))
+            blob += encoded
+
+    if sys.byteorder != "little":
+        table.byteswap()
+
+    with open(out_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(faq_data)))
+        f.write(table.tobytes())
+        f.write(blob)
+
+    return len(faq_data)
+
+
+def is_faq_store(path: str) -> bool:
+    """True if `path` is a packed FAQ store (checked by magic bytes)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class _LazyTexts(Sequence):
+    """Read-only list-like view that decodes one field on each access."""
+
+    def __init__(self, store, field: int):
+        self._store = store
+        self._field = field
+
+    def __len__(self):
+        return len(self._store)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return self._store._text(idx, self._field)
+
+
+class FaqStore:
+    """
+    Memory-mapped view over a packed FAQ file.
+
+    - `questions` / `answers` behave like read-only lists of str
+    - nothing is decoded until an item is indexed
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a packed FAQ store")
+        if version != VERSION:
+            raise ValueError(f"Unsupported FAQ store version {version} in {path}")
+
+        self._count = count
+        table_end = HEADER.size + count * FIELDS_PER_ITEM * 4
+        self._table = array("I", self._mm[HEADER.size:table_end])
+        if sys.byteorder != "little":
+            self._table.byteswap()
+        self._blob_start = table_end
+
+        self.questions = _LazyTexts(self, 0)
+        self.answers = _LazyTexts(self, 1)
+
+    def __len__(self):
+        return self._count
+
+    def _text(self, idx: int, field: int) -> str:
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("FAQ index out of range")
+
+        pos = idx * FIELDS_PER_ITEM + field * 2
+        start = self._blob_start + self._table[pos]
+        end = start + self._table[pos + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+
+# ================================================================
+#             STARTUP / MEMORY COMPARISON WITH JSON LOADER
+# ================================================================
+
+def _load_like_json(path: str):
+    """What CollegeChatbot keeps in memory when loading faq_data.json."""
+    with open(path, "r", encoding="utf-8") as f:
+        faq_data = json.load(f)
+    questions = [item["question"] for item in faq_data]
+    answers = [item["answer"] for item in faq_data]
+    questions_lower = [q.lower() for q in questions]
+    return faq_data, questions, answers, questions_lower
+
+
+def _load_like_store(path: str):
+    """What CollegeChatbot keeps in memory when opening a packed store."""
+    store = FaqStore(path)
+    questions_lower = [q.lower() for q in store.questions]
+    return store, questions_lower
+
+
+def _measure(kind: str, path: str) -> dict:
+    import resource
+    import tracemalloc
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    loaded = _load_like_json(path) if kind == "json" else _load_like_store(path)
+    elapsed = time.perf_counter() - start
+    heap, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    del loaded
+
+    return {
+        "loader": kind,
+        "startup_ms": round(elapsed * 1000, 3),
+        "python_heap_kb": round(heap / 1024, 1),
+        "max_rss_growth_kb": rss_after - rss_before,  # ru_maxrss is KB on Linux
+    }
+
+
+def bench(json_path: str, store_path: str):
+    """Measure each loader in a fresh interpreter so RSS numbers are comparable."""
+    for kind, path in (("json", json_path), ("store", store_path)):
+        out = subprocess.run(
+            [sys.executable, __file__, "_measure", kind, path],
+            check=True, capture_output=True, text=True,
+        )
+        print(out.stdout.strip())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "build":
+        n = build_faq_store(sys.argv[2], sys.argv[3])
+        print(f"Packed {n} FAQ entries into {sys.argv[3]}")
+    elif len(sys.argv) == 4 and sys.argv[1] == "bench":
+        bench(sys.argv[2], sys.argv[3])
+    elif len(sys.argv) == 4 and sys.argv[1] == "_measure":
+        print(json.dumps(_measure(sys.argv[2], sys.argv[3])))
+    else:
+        print(__doc__)
+        sys.exit(1)
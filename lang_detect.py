@@ -0,0 +1,349 @@
+"""
+Fast local language detection.
+
+Used to decide whether a user message needs a translator round trip before
+it is matched against the (English) FAQ. Two cheap checks:
+
+1. Unicode script ranges for the Indian scripts offered in the UI
+   (Kannada, Devanagari, Tamil, Telugu, Malayalam, Bengali).
+2. A small character-trigram model for Latin text. Text only counts as
+   English when the English model clearly wins; romanized Hindi / Kannada
+   ("hostel fee kitna hai", "hostel yelli ide"), unaccented Spanish, French
+   or German, and anything that doesn't clearly look English go to the
+   translator.
+
+Run `python chatbot/lang_detect.py` to print accuracy on a labelled sample
+set and how many translator calls would be avoided.
+"""
+
+import math
+import re
+from collections import Counter
+
+# (first code point, last code point, language code)
+SCRIPT_RANGES = [
+    (0x0900, 0x097F, "hi"),   # Devanagari (Hindi, Marathi)
+    (0x0980, 0x09FF, "bn"),   # Bengali
+    (0x0B80, 0x0BFF, "ta"),   # Tamil
+    (0x0C00, 0x0C7F, "te"),   # Telugu
+    (0x0C80, 0x0CFF, "kn"),   # Kannada
+    (0x0D00, 0x0D7F, "ml"),   # Malayalam
+]
+
+# Small training texts for the romanized-text model
+_TRAINING_TEXT = {
+    "en": [
+        "what is the fee structure for btech computer science",
+        "how can i apply for admission at the university",
+        "where is the campus located and how do i get there",
+        "does the college provide hostel facilities for girls and boys",
+        "what are the placement statistics for last year",
+        "tell me about the scholarships available for students",
+        "which courses are offered in the school of engineering",
+        "when does the academic year start and what is the last date",
+        "is there transport facility from the city to the campus",
+        "what documents are required at the time of admission",
+        "how much is the hostel fee per year including mess",
+        "can you give me the contact number of the admission office",
+        "what are the eligibility criteria for the mba programme",
+        "are there any clubs sports and cultural events on campus",
+        "please list the schools and departments of the university",
+        "thank you for the information that was very helpful",
+        "hello hi hey good morning good evening how are you",
+        "ok okay bye goodbye see you later thanks a lot",
+        "yes no please help me with my question",
+        "btech cse ece mba bba bca mca bcom mbbs fees hostel mess exam results",
+        "list of courses and programs offered by each school",
+        "courses hostel hostels fees scholarships library timings transport",
+        "which undergraduate and postgraduate programs are available",
+        "do you offer online degree programs and distance learning",
+        "does the university provide placement support and internships",
+        "research and phd programs with supervisors and labs",
+        "how is student life and why should i choose this university",
+        "tell me in simple words about the design and digital media school",
+        "all the courses of study at the college of law medicine and nursing",
+        "do they have a gym a swimming pool and a medical centre",
+        "what is the application process and selection procedure",
+        "how to get the bonafide certificate and the migration certificate",
+        "when will the semester timetable and the exam schedule be published",
+        "what is the deadline for the payment of tuition fees",
+        "who should i contact about the attendance rules and the library card",
+    ],
+    "hi-Latn": [
+        "mujhe admission ke baare mein jaankari chahiye",
+        "hostel ki fees kitni hai bataiye",
+        "college kahan par hai aur kaise pahunche",
+        "kya yahan ladkiyon ke liye hostel hai",
+        "placement kaisa hota hai is college mein",
+        "btech ki fees kya hai aur kitne saal ka course hai",
+        "mujhe batao ki kaun kaun se course hain",
+        "scholarship milti hai kya gareeb chhatron ko",
+        "admission ki aakhri tareekh kab hai",
+        "kya bus ki suvidha hai shahar se",
+        "aap kaise ho bhai mujhe madad chahiye",
+        "yeh university achhi hai ya nahi",
+        "kitna kharcha aayega pure saal ka",
+    ],
+    "kn-Latn": [
+        "hostel fees eshtu ide heli",
+        "college elli ide hege hogodu",
+        "nanage admission bagge mahiti beku",
+        "yava yava course ide ee university alli",
+        "hudugiyarige hostel ideya",
+        "placement hege agutte illi",
+        "btech fees eshtu varshakke",
+        "scholarship sigutta enu",
+        "admission kone dina yavaga",
+        "bus suvidhe ideya nagaradinda",
+        "neevu hegiddira nanage sahaya beku",
+        "ee college chennagide alva",
+    ],
+    # Other Latin-script languages, typed without accents as users do.
+    # They give the model positive evidence against English.
+    "es": [
+        "donde esta la universidad y como puedo llegar",
+        "cuanto cuesta la matricula por ano",
+        "quiero informacion sobre la admision",
+        "hay residencia para estudiantes en el campus",
+        "que cursos ofrece la facultad de ingenieria",
+        "cual es la fecha limite para inscribirse",
+        "tienen becas para estudiantes extranjeros",
+        "gracias por la ayuda muy amable",
+    ],
+    "fr": [
+        "ou se trouve l universite et comment y aller",
+        "quels sont les frais de scolarite par an",
+        "je voudrais des informations sur l admission",
+        "est ce qu il y a un logement pour les etudiants",
+        "quelles formations propose l ecole d ingenieurs",
+        "quelle est la date limite pour s inscrire",
+        "avez vous des bourses pour les etudiants etrangers",
+        "merci beaucoup pour votre aide",
+    ],
+    "de": [
+        "wo ist die universitaet und wie komme ich dorthin",
+        "wie hoch sind die studiengebuehren pro jahr",
+        "ich moechte informationen zur zulassung",
+        "gibt es ein wohnheim fuer studenten auf dem campus",
+        "welche studiengaenge bietet die ingenieurschule an",
+        "wann ist die letzte frist fuer die bewerbung",
+        "gibt es stipendien fuer auslaendische studenten",
+        "vielen dank fuer ihre hilfe",
+    ],
+}
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def _trigrams(text: str):
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            yield padded[i:i + 3]
+
+
+class _TrigramModel:
+    """Add-one smoothed character trigram log-probabilities per language."""
+
+    def __init__(self, training):
+        self.counts = {}
+        self.totals = {}
+        vocab = set()
+        for lang, lines in training.items():
+            counts = Counter(g for line in lines for g in _trigrams(line))
+            self.counts[lang] = counts
+            self.totals[lang] = sum(counts.values())
+            vocab.update(counts)
+        self.vocab_size = len(vocab) + 1
+
+    def scores(self, text: str):
+        grams = list(_trigrams(text))
+        if not grams:
+            return {}
+        result = {}
+        for lang, counts in self.counts.items():
+            denom = self.totals[lang] + self.vocab_size
+            result[lang] = sum(math.log((counts[g] + 1) / denom) for g in grams) / len(grams)
+        return result
+
+
+_MODEL = _TrigramModel(_TRAINING_TEXT)
+
+# Latin text counts as English only with positive evidence: the English
+# model must beat every other model by EN_MARGIN and reach EN_MIN_LOGPROB
+# (avg log-prob per trigram). Anything else goes to the translator.
+EN_MARGIN = 0.05
+EN_MIN_LOGPROB = -7.0
+
+# Fewer trigrams than this is too little evidence ("hi", "ok") -> English
+MIN_TRIGRAMS = 6
+
+
+def detect_script(text: str):
+    """
+    Return the language code of the dominant Indian script in `text`,
+    or None if the text is (mostly) not in one of those scripts.
+    """
+    counts = Counter()
+    letters = 0
+    for ch in text:
+        if not ch.isalpha():
+            continue
+        letters += 1
+        cp = ord(ch)
+        for first, last, lang in SCRIPT_RANGES:
+            if first <= cp <= last:
+                counts[lang] += 1
+                break
+
+    if not counts:
+        return None
+    lang, n = counts.most_common(1)[0]
+    return lang if n * 2 >= letters or n >= 3 else None
+
+
+def detect_language(text: str) -> str:
+    """
+    Best local guess of the language of `text`:
+      - "kn", "hi", "ta", "te", "ml", "bn"  for native scripts
+      - "hi-Latn", "kn-Latn"                for romanized Hindi / Kannada
+      - "es", "fr", "de"                    for other Latin-script languages
+      - "other"                             for non-ASCII letters, or Latin
+                                            text that doesn't look English
+      - "en"                                for text that clearly looks English,
+                                            and numbers / very short input
+    """
+    script_lang = detect_script(text)
+    if script_lang:
+        return script_lang
+
+    if any(ch.isalpha() and not ch.isascii() for ch in text):
+        return "other"
+
+    if sum(1 for _ in _trigrams(text)) < MIN_TRIGRAMS:
+        return "en"  # digits, punctuation, emoji, one short word
+
+    scores = _MODEL.scores(text)
+
+    en_score = scores.pop("en")
+    best = max(scores, key=scores.get)
+    if en_score - scores[best] >= EN_MARGIN and en_score >= EN_MIN_LOGPROB:
+        return "en"
+    return best if scores[best] > en_score else "other"
+
+
+def needs_translation(text: str) -> bool:
+    """True if `text` should go through translate_to_english."""
+    return detect_language(text) != "en"
+
+
+# ================================================================
+#                            EVALUATION
+# ================================================================
+
+# (text, expected language). Held out: none of these (nor any run of their
+# words) appears in the training text above, so the numbers reflect unseen
+# phrasings.
+LABELLED_SAMPLES = [
+    ("What is Dayananda Sagar University?", "en"),
+    ("Where is DSU located?", "en"),
+    ("hostel fees for girls", "en"),
+    ("what are the corses at dsu", "en"),
+    ("Is there a library on campus?", "en"),
+    ("fee payment deadline", "en"),
+    ("How do I reach the Harohalli campus?", "en"),
+    ("3", "en"),
+    ("10", "en"),
+    ("hii", "en"),
+    ("hey there", "en"),
+    ("ok bye", "en"),
+    ("thank u so much", "en"),
+    ("Tell me about MBBS admission", "en"),
+    ("btech cse fees", "en"),
+    ("Does DSU have a gym?", "en"),
+    ("admission process", "en"),
+    ("What entrance exams are accepted for B.Tech?", "en"),
+    ("How can I contact DSU for admission queries?", "en"),
+    ("Is there a canteen?", "en"),
+    ("Can I pay fees online?", "en"),
+    ("How do I get a transfer certificate?", "en"),
+    ("Who is the vice chancellor?", "en"),
+    ("Are there sports facilities?", "en"),
+    ("semester exam timetable", "en"),
+    ("what are the placement companies", "en"),
+    ("what is the placement record", "en"),
+    ("is there wifi in the hostel", "en"),
+    ("Does the hostel have a laundry?", "en"),
+    ("refund process", "en"),
+    ("How do I get my id card?", "en"),
+    ("exam schedule for first year", "en"),
+    ("what is the last date for payment", "en"),
+    ("Do you have a cricket ground?", "en"),
+    ("fee receipt download", "en"),
+    ("Is there a dress code?", "en"),
+    ("application status", "en"),
+    ("How to get a bus pass?", "en"),
+    ("what are the mess timings", "en"),
+    ("is ragging allowed", "en"),
+    ("documents needed for hostel", "en"),
+    ("Can I change my branch?", "en"),
+    ("What is the attendance requirement?", "en"),
+    ("ಹಾಸ್ಟೆಲ್ ಶುಲ್ಕ ಎಷ್ಟು?", "kn"),
+    ("ವಿಶ್ವವಿದ್ಯಾಲಯ ಎಲ್ಲಿದೆ", "kn"),
+    ("हॉस्टल की फीस कितनी है?", "hi"),
+    ("प्रवेश प्रक्रिया क्या है", "hi"),
+    ("वसतिगृहाचे शुल्क किती आहे?", "hi"),
+    ("விடுதி கட்டணம் எவ்வளவு?", "ta"),
+    ("హాస్టల్ ఫీజు ఎంత?", "te"),
+    ("ഹോസ്റ്റൽ ഫീസ് എത്രയാണ്?", "ml"),
+    ("হোস্টেল ফি কত?", "bn"),
+    ("mera admission kab hoga", "hi-Latn"),
+    ("mujhe admission chahiye", "hi-Latn"),
+    ("college kahan hai", "hi-Latn"),
+    ("kaun se course milte hain", "hi-Latn"),
+    ("library kab khulti hai", "hi-Latn"),
+    ("fees kitni lagti hai", "hi-Latn"),
+    ("hostel mein khana kaisa hai", "hi-Latn"),
+    ("fees kab tak bharni hai", "hi-Latn"),
+    ("ragging hoti hai kya", "hi-Latn"),
+    ("canteen elli ide", "kn-Latn"),
+    ("exam yavaga", "kn-Latn"),
+    ("nanage course bagge heli", "kn-Latn"),
+    ("bus facility ideya", "kn-Latn"),
+    ("mess oota hege ide", "kn-Latn"),
+    ("fees yavaga kattabeku", "kn-Latn"),
+    ("Où se trouve l'université?", "other"),
+    ("donde esta la biblioteca", "es"),
+    ("cuanto cuesta el hostal", "es"),
+    ("hay gimnasio en la universidad", "es"),
+    ("gibt es eine bibliothek", "de"),
+    ("wie viel kostet das studium", "de"),
+    ("wann beginnt das semester", "de"),
+    ("quel est le prix du logement", "fr"),
+    ("ou est le campus", "fr"),
+    ("y a t il une cantine", "fr"),
+]
+
+
+def evaluate(samples=LABELLED_SAMPLES):
+    """Return (language accuracy, routing accuracy, translator calls avoided)."""
+    lang_correct = route_correct = avoided = 0
+    for text, expected in samples:
+        got = detect_language(text)
+        lang_correct += got == expected
+        route_correct += (got != "en") == (expected != "en")
+        avoided += got == "en"
+    n = len(samples)
+    return lang_correct / n, route_correct / n, avoided
+
+
+if __name__ == "__main__":
+    lang_acc, route_acc, avoided = evaluate()
+    n = len(LABELLED_SAMPLES)
+    for text, expected in LABELLED_SAMPLES:
+        got = detect_language(text)
+        mark = "ok " if got == expected else "BAD"
+        print(f"{mark} {expected:>8} -> {got:<8} {text}")
+    print(f"\nLanguage accuracy:    {lang_acc:.1%}")
+    print(f"Translate/skip right: {route_acc:.1%}")
+    print(f"Translator calls avoided: {avoided}/{n}")
@@ -0,0 +1,330 @@
+"""
+loadtest.py  –  concurrent load generator for the /chat endpoint
+
+Replays a weighted mix of realistic /chat payloads (FAQ questions, typos,
+numeric option replies with `topic`, menu queries, small talk) in all the
+languages offered by index.html, at a fixed concurrency and arrival rate,
+and reports throughput, error / shed / degraded rates and latency
+percentiles per route branch.
+
+By default it starts app.py in-process with the offline translator, so only
+our own code is measured:
+
+    python loadtest.py --concurrency 16 --rate 40 --duration 60
+    python loadtest.py --translator-latency 150 --requests 2000
+    python loadtest.py --url http://127.0.0.1:5000   # an already running server
+
+Latency is measured from the scheduled arrival time, so time spent waiting
+for a free client is counted (open-loop; no coordinated omission).
+
+Under overload the server still answers 200, so each reply is classified:
+"shed" (the busy message), "degraded" (X-Degraded header: English-only or
+fuzzy-matched reply), "ok", or "error" (non-200 / timeout). The report ends
+with the server's /stats overload counters for the run.
+"""
+
+import argparse
+import json
+import queue
+import random
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+
+from chatbot.admission import BUSY_MESSAGE
+
+FAQ_FILE = "data/faq_data.json"
+
+# Same choices as the language selector in index.html ('' = English)
+LANGUAGES = ["", "kn", "hi", "ta", "te", "ml", "mr", "bn"]
+LANGUAGE_WEIGHTS = [60, 10, 8, 6, 6, 4, 3, 3]
+
+FALLBACK_QUESTIONS = [
+    "What is Dayananda Sagar University?",
+    "Where is DSU located?",
+    "How can I apply for admission at DSU?",
+    "Does DSU have hostel facilities?",
+]
+
+# /stats counters that count shed / degraded replies
+OVERLOAD_COUNTERS = [
+    "shed", "degraded_fuzzy", "degraded_translate_in", "degraded_translate_out", "tenant_loading",
+]
+
+# route branch -> weight in the traffic mix
+BRANCH_WEIGHTS = {
+    "faq": 40,
+    "typo": 15,
+    "courses_menu": 8,
+    "courses_option": 10,
+    "fee_menu": 7,
+    "fee_option": 8,
+    "faq_option": 5,
+    "small_talk": 5,
+    "empty": 2,
+}
+
+
+# ================================================================
+#                       PAYLOAD GENERATION
+# ================================================================
+
+def load_questions(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [item["question"] for item in json.load(f)]
+    except (OSError, ValueError, KeyError):
+        return list(FALLBACK_QUESTIONS)
+
+
+def add_typo(text: str, rng: random.Random) -> str:
+    """Drop, double or swap one letter inside a random word."""
+    words = text.split()
+    candidates = [i for i, w in enumerate(words) if len(w) > 3]
+    if not candidates:
+        return text
+    i = rng.choice(candidates)
+    w = words[i]
+    pos = rng.randrange(1, len(w) - 1)
+    edit = rng.choice(["drop", "double", "swap"])
+    if edit == "drop":
+        w = w[:pos] + w[pos + 1:]
+    elif edit == "double":
+        w = w[:pos] + w[pos] + w[pos:]
+    else:
+        w = w[:pos - 1] + w[pos] + w[pos - 1] + w[pos + 1:]
+    words[i] = w
+    return " ".join(words)
+
+
+def make_payload(branch: str, questions, rng: random.Random) -> dict:
+    message, topic = "", ""
+
+    if branch == "faq":
+        message = rng.choice(questions)
+    elif branch == "typo":
+        message = add_typo(rng.choice(questions), rng)
+    elif branch == "courses_menu":
+        message = rng.choice(["What courses does DSU offer?", "list of corses", "which branches are there"])
+    elif branch == "courses_option":
+        message, topic = str(rng.randint(1, 10)), "courses"
+    elif branch == "fee_menu":
+        message = rng.choice(["fee structure", "what are the fess", "tell me about fees"])
+    elif branch == "fee_option":
+        message, topic = str(rng.randint(1, 2)), "fee"
+    elif branch == "faq_option":
+        message, topic = str(rng.randrange(len(questions))), "faq"
+    elif branch == "small_talk":
+        message = rng.choice(["hi", "hello there", "thank you", "bye"])
+
+    lang = rng.choices(LANGUAGES, weights=LANGUAGE_WEIGHTS)[0]
+    return {"message": message, "topic": topic, "lang": lang}
+
+
+# ================================================================
+#                          LOAD DRIVER
+# ================================================================
+
+def start_local_server(translator_latency_ms: float):
+    """Run app.py in a background thread with the offline translator."""
+    from werkzeug.serving import make_server
+
+    import app as chat_app
+    from offline_translator import install
+
+    install(chat_app, latency_ms=translator_latency_ms)
+    server = make_server("127.0.0.1", 0, chat_app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def post_chat(url: str, payload: dict, timeout: float) -> str:
+    """Send one request; return "ok", "shed", "degraded" or "error"."""
+    body = json.dumps(payload).encode("utf-8")
+    req = urllib.request.Request(
+        url + "/chat", data=body, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as res:
+        data = json.loads(res.read().decode("utf-8"))
+        degraded = res.headers.get("X-Degraded")
+    if res.status != 200 or "reply" not in data:
+        return "error"
+    if data["reply"] == BUSY_MESSAGE:
+        return "shed"
+    return "degraded" if degraded else "ok"
+
+
+def fetch_stats(url: str, timeout: float):
+    """The server's /stats counters, or None if unavailable."""
+    try:
+        with urllib.request.urlopen(url + "/stats", timeout=timeout) as res:
+            return json.loads(res.read().decode("utf-8"))
+    except Exception:
+        return None
+
+
+def run_load(url: str, questions, concurrency: int, rate: float, total: int,
+             duration: float, timeout: float, seed: int):
+    """
+    Generate arrivals (Poisson at `rate` per second, or back-to-back when
+    rate is 0) and send them with `concurrency` client threads.
+
+    Returns (results, wall_seconds) where results maps branch ->
+    list of (latency_seconds, outcome) with outcome as from post_chat().
+    """
+    rng = random.Random(seed)
+    branches = list(BRANCH_WEIGHTS)
+    weights = list(BRANCH_WEIGHTS.values())
+
+    work = queue.Queue(maxsize=concurrency * 4)
+    results = defaultdict(list)
+    lock = threading.Lock()
+
+    def client():
+        while True:
+            item = work.get()
+            if item is None:
+                return
+            scheduled, branch, payload = item
+            try:
+                outcome = post_chat(url, payload, timeout)
+            except Exception:
+                outcome = "error"
+            latency = time.perf_counter() - scheduled
+            with lock:
+                results[branch].append((latency, outcome))
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+
+    start = time.perf_counter()
+    next_arrival = start
+    sent = 0
+    while (total and sent < total) or (not total and time.perf_counter() - start < duration):
+        if rate > 0:
+            next_arrival += rng.expovariate(rate)
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        else:
+            next_arrival = time.perf_counter()
+
+        branch = rng.choices(branches, weights=weights)[0]
+        work.put((next_arrival, branch, make_payload(branch, questions, rng)))
+        sent += 1
+
+    for _ in threads:
+        work.put(None)
+    for t in threads:
+        t.join()
+
+    return results, time.perf_counter() - start
+
+
+# ================================================================
+#                             REPORT
+# ================================================================
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[k]
+
+
+def summarize(samples, wall: float) -> dict:
+    latencies = sorted(lat for lat, _ in samples)
+    n = len(samples)
+
+    def rate(outcome):
+        return round(sum(1 for _, o in samples if o == outcome) / n, 4) if n else 0.0
+
+    return {
+        "requests": n,
+        "throughput_rps": round(n / wall, 2) if wall else 0.0,
+        "error_rate": rate("error"),
+        "shed_rate": rate("shed"),
+        "degraded_rate": rate("degraded"),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round((latencies[-1] if latencies else 0.0) * 1000, 1),
+    }
+
+
+def print_report(results, wall: float, overload=None):
+    """
+    overload: /stats counter deltas for the run (OVERLOAD_COUNTERS), or None
+    """
+    rows = {branch: summarize(samples, wall) for branch, samples in sorted(results.items())}
+    rows["ALL"] = summarize([s for samples in results.values() for s in samples], wall)
+
+    header = (f"{'branch':<16}{'reqs':>7}{'rps':>9}{'err%':>8}{'shed%':>8}{'degr%':>8}"
+              f"{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}")
+    print(header)
+    print("-" * len(header))
+    for branch, r in rows.items():
+        print(
+            f"{branch:<16}{r['requests']:>7}{r['throughput_rps']:>9}"
+            f"{r['error_rate'] * 100:>7.2f}%{r['shed_rate'] * 100:>7.2f}%"
+            f"{r['degraded_rate'] * 100:>7.2f}%{r['p50_ms']:>9}{r['p90_ms']:>9}"
+            f"{r['p99_ms']:>9}{r['max_ms']:>9}"
+        )
+    print(f"\nWall time: {wall:.1f}s  (latencies in ms)")
+    if overload is not None:
+        print("Server overload counters: " + ", ".join(f"{k}={v}" for k, v in overload.items()))
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for the /chat endpoint")
+    parser.add_argument("--url", help="target an already running server instead of starting one")
+    parser.add_argument("--concurrency", type=int, default=8, help="client threads (default: 8)")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="arrivals per second, Poisson; 0 = as fast as clients allow")
+    parser.add_argument("--requests", type=int, default=0, help="stop after N requests")
+    parser.add_argument("--duration", type=float, default=30.0,
+                        help="seconds to run when --requests is not given (default: 30)")
+    parser.add_argument("--translator-latency", type=float, default=0.0,
+                        help="simulated translator round trip in ms (local server only)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--faq", default=FAQ_FILE, help="FAQ file to draw questions from")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", metavar="FILE", help="also write the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    server = None
+    url = args.url
+    if not url:
+        server, url = start_local_server(args.translator_latency)
+
+    url = url.rstrip("/")
+    try:
+        before = fetch_stats(url, args.timeout)
+        results, wall = run_load(
+            url, load_questions(args.faq), args.concurrency, args.rate,
+            args.requests, args.duration, args.timeout, args.seed,
+        )
+        after = fetch_stats(url, args.timeout)
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    overload = None
+    if before is not None and after is not None:
+        overload = {k: after.get(k, 0) - before.get(k, 0) for k in OVERLOAD_COUNTERS}
+
+    rows = print_report(results, wall, overload)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,18 @@
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 from chatbot.model import CollegeChatbot
 from chatbot.small_talk import handle_small_talk
 
 FAQ_FILE = "data/faq_data.json"
 
+# Each batch worker process keeps its own chatbot (loaded once per worker)
+_worker_bot = None
+
 
 def main():
     print("==============================================")
@@ -28,5 +38,143 @@ def main():
         print("Bot:", answer)
 
 
+# ================================================================
+#                  BATCH MODE (offline regression runs)
+# ================================================================
+
+def _init_worker(faq_path: str, torch_threads: int = 0):
+    """
+    Load the model once per worker process.
+
+    torch_threads > 0 caps torch's intra-op thread pool, so N workers don't
+    start N x cores threads and fight over the CPU (0 = torch default).
+    """
+    global _worker_bot
+    if torch_threads > 0:
+        import torch
+        torch.set_num_threads(torch_threads)
+    _worker_bot = CollegeChatbot(faq_path)
+
+
+def _answer_query(query: str) -> dict:
+    """
+    Run one query through the bot and return a JSON-serialisable record:
+    query, type, chosen index, score and latency in milliseconds.
+
+    type is "answer" for a matched FAQ, "clarify" for ambiguity options,
+    "fallback" for the "not sure" / "didn't catch that" replies and
+    "small_talk" for greetings.
+    """
+    start = time.perf_counter()
+
+    if handle_small_talk(query):
+        record = {"type": "small_talk", "index": None, "score": None}
+    else:
+        result = _worker_bot.get_reply(query)
+        if result["type"] == "clarify":
+            best = result["options"][0]
+            record = {
+                "type": "clarify",
+                "index": best["index"],
+                "score": best["score"],
+                "options": [opt["index"] for opt in result["options"]],
+            }
+        else:
+            # get_reply() answers without a FAQ index are its fallback replies
+            record = {
+                "type": "answer" if result.get("index") is not None else "fallback",
+                "index": result.get("index"),
+                "score": result.get("score"),
+            }
+
+    record["latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    record["query"] = query
+    return record
+
+
+def _read_queries(stream):
+    """Yield non-empty lines one at a time (never reads the whole input)."""
+    for line in stream:
+        query = line.strip()
+        if query:
+            yield query
+
+
+def run_batch(in_stream, out_stream, faq_path: str = FAQ_FILE, workers: int = 1,
+              torch_threads: int = 1):
+    """
+    Stream queries from `in_stream` and write one JSON line per query to
+    `out_stream`, in input order, as soon as each result is ready.
+
+    With workers > 1 the queries are spread over a process pool. Only a
+    small window of queries is in flight at a time, so memory stays flat
+    no matter how large the input is. Each worker uses `torch_threads`
+    torch threads, so throughput scales with the number of workers.
+    """
+    queries = _read_queries(in_stream)
+
+    def write(record):
+        out_stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out_stream.flush()
+
+    if workers <= 1:
+        _init_worker(faq_path)
+        for query in queries:
+            write(_answer_query(query))
+        return
+
+    max_pending = workers * 4
+    pending = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(faq_path, torch_threads),
+    ) as pool:
+        for query in queries:
+            pending.append(pool.submit(_answer_query, query))
+            if len(pending) >= max_pending:
+                write(pending.popleft().result())
+
+        while pending:
+            write(pending.popleft().result())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="College Query Chatbot")
+    parser.add_argument(
+        "--batch", metavar="FILE",
+        help="run queries from FILE (one per line, '-' for stdin) and print JSONL results"
+    )
+    parser.add_argument(
+        "--output", metavar="FILE", default="-",
+        help="where to write JSONL results in batch mode (default: stdout)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of worker processes in batch mode (default: 1)"
+    )
+    parser.add_argument(
+        "--threads", type=int, default=1,
+        help="torch threads per worker process when --workers > 1 (default: 1, 0 = torch default)"
+    )
+    parser.add_argument("--faq", default=FAQ_FILE, help="path to faq_data.json")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+
+    if args.batch is None:
+        main()
+    else:
+        in_stream = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+        out_stream = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+        try:
+            run_batch(in_stream, out_stream, faq_path=args.faq, workers=args.workers,
+                      torch_threads=args.threads)
+        finally:
+            if in_stream is not sys.stdin:
+                in_stream.close()
+            if out_stream is not sys.stdout:
+                out_stream.close()
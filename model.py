@@ -3,6 +3,9 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 from difflib import SequenceMatcher   # <-- added for spelling mistake detection
+from chatbot.faq_store import FaqStore, is_faq_store
+
+MODEL_NAME = "all-MiniLM-L6-v2"
 
 
 class CollegeChatbot:
@@ -15,33 +18,42 @@ class CollegeChatbot:
     """
 
     def __init__(self, faq_path: str, threshold: float = 0.55, ambiguity_margin=0.10,
-                 fuzzy_threshold: float = 0.75):
+                 fuzzy_threshold: float = 0.75, model=None):
         """
-        faq_path: path to data/faq_data.json
+        faq_path: path to data/faq_data.json, or a packed store built by
+                  chatbot/faq_store.py (memory-mapped, answers decoded lazily)
         threshold: minimum embedding similarity to accept answer
         ambiguity_margin: how close #2 match must be to #1 to trigger clarification
         fuzzy_threshold: minimum fuzzy ratio to trigger spelling correction
+        model: already loaded SentenceTransformer to share between chatbots
+               (loaded here if not given)
         """
         self.threshold = threshold
         self.ambiguity_margin = ambiguity_margin
         self.fuzzy_threshold = fuzzy_threshold
 
         # Load FAQ data
-        with open(faq_path, "r", encoding="utf-8") as f:
-            self.faq_data = json.load(f)
-
-        self.questions = [item["question"] for item in self.faq_data]
-        self.answers = [item["answer"] for item in self.faq_data]
+        if is_faq_store(faq_path):
+            # Packed store: questions/answers are lazy views over an mmap
+            self.store = FaqStore(faq_path)
+            self.questions = self.store.questions
+            self.answers = self.store.answers
+        else:
+            self.store = None
+            with open(faq_path, "r", encoding="utf-8") as f:
+                faq_data = json.load(f)
+            self.questions = [item["question"] for item in faq_data]
+            self.answers = [item["answer"] for item in faq_data]
 
         # Lowercase copy for fuzzy matching
         self.questions_lower = [q.lower() for q in self.questions]
 
-        # Load SentenceTransformer embedding model
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+        # Load SentenceTransformer embedding model (or reuse a shared one)
+        self.model = model if model is not None else SentenceTransformer(MODEL_NAME)
 
         # Pre-compute question embeddings
         self.question_embeddings = self.model.encode(
-            self.questions,
+            list(self.questions),
             convert_to_numpy=True,
             normalize_embeddings=True,
         )
@@ -98,7 +110,6 @@ class CollegeChatbot:
                     "index": int(idx),
                     "score": float(scores[idx]),
                     "question": self.questions[idx],
-                    "answer": self.answers[idx],
                 }
             )
         return matches
@@ -125,7 +136,9 @@ class CollegeChatbot:
             if fuzzy_idx is not None:
                 return {
                     "type": "answer",
-                    "text": self.answers[fuzzy_idx]
+                    "text": self.answers[fuzzy_idx],
+                    "index": fuzzy_idx,
+                    "score": best_score,
                 }
 
             # Still not sure
@@ -135,7 +148,9 @@ class CollegeChatbot:
                     "I'm not completely sure about that. "
                     "Try rephrasing your question or ask something related to "
                     "courses, fees, hostel or admissions."
-                )
+                ),
+                "index": None,
+                "score": best_score,
             }
 
         # 3) Check ambiguity → offer clarification options
@@ -150,10 +165,12 @@ class CollegeChatbot:
                 "options": ambiguous
             }
 
-        # 4) Confident single answer
+        # 4) Confident single answer (only now is the answer text decoded)
         return {
             "type": "answer",
-            "text": best["answer"]
+            "text": self.answers[best["index"]],
+            "index": best["index"],
+            "score": best_score,
         }
 
     # Compatibility for old calls
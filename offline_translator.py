@@ -0,0 +1,42 @@
+"""
+offline_translator.py  –  network-free stand-in for GoogleTranslator
+
+Used by the load-testing and replay tools so that runs are repeatable and do
+not depend on (or hammer) the real translation service.
+
+    import app
+    from offline_translator import install
+    install(app, latency_ms=120)   # simulate a ~120 ms translator round trip
+"""
+
+import time
+
+
+class OfflineTranslator:
+    """
+    Same call shape as deep_translator.GoogleTranslator:
+        OfflineTranslator(source="auto", target="en").translate(text)
+
+    English targets return the text unchanged; other targets return the text
+    tagged with the language code so translated replies are recognisable.
+    """
+
+    latency_ms = 0.0
+
+    def __init__(self, source: str = "auto", target: str = "en"):
+        self.source = source
+        self.target = target
+
+    def translate(self, text: str) -> str:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        if self.target == "en" or self.target == self.source:
+            return text
+        return f"[{self.target}] {text}"
+
+
+def install(app_module, latency_ms: float = 0.0):
+    """Replace the translator used by app.py with the offline stand-in."""
+    OfflineTranslator.latency_ms = latency_ms
+    app_module.GoogleTranslator = OfflineTranslator
+    return OfflineTranslator
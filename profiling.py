@@ -0,0 +1,227 @@
+"""
+On-demand per-request profiling.
+
+A ProfileRing captures a call-stack profile of one request and keeps the most
+recent `max_entries` profiles on disk (oldest are deleted), with a small JSON
+index so the slowest captures can be listed.
+
+Only the request's own thread is profiled. Up to Python 3.11 that is what
+cProfile does; from 3.12 cProfile is built on sys.monitoring and records
+every thread in the process, so concurrent requests would show up in each
+other's profiles. There a ThreadSampler samples the request thread's stack
+instead (entries are marked "profiler": "sampled").
+
+    ring = ProfileRing("profiles", max_entries=100)
+    with ring.capture("/chat", {"message": msg}):
+        ...  # handle the request
+
+Saved .prof files open with the standard tools
+(`python -m pstats profiles/<id>.prof`, snakeviz, etc.).
+"""
+
+import cProfile
+import io
+import json
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+# cProfile only profiles the calling thread before sys.monitoring (3.12)
+CPROFILE_IS_PER_THREAD = sys.version_info < (3, 12)
+
+SAMPLE_INTERVAL_S = 0.001
+
+
+class ThreadSampler:
+    """
+    Statistical profiler for one thread: a helper thread reads that thread's
+    stack from sys._current_frames() every `interval` seconds.
+
+    Same enable() / disable() / create_stats() / dump_stats() surface as
+    cProfile.Profile, and the dump opens with pstats, snakeviz, etc.
+    "ncalls" counts samples; times are wall-clock seconds between samples.
+    """
+
+    def __init__(self, thread_id: int = None, interval: float = SAMPLE_INTERVAL_S,
+                 outer_frame=None):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.outer_frame = outer_frame  # this frame and its callers are left out
+        self.stats = {}
+        self._stacks = {}  # stack (outermost first) -> [samples, seconds]
+        self._stop = threading.Event()
+        self._thread = None
+
+    def enable(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.outer_frame = None
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+
+            stack = []
+            while frame is not None and frame is not self.outer_frame:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                counts = self._stacks.setdefault(tuple(reversed(stack)), [0, 0.0])
+                counts[0] += 1
+                counts[1] += elapsed
+
+    def create_stats(self):
+        """Fill self.stats in pstats form: func -> (cc, nc, tt, ct, callers)."""
+        stats = {}
+        for stack, (n, seconds) in self._stacks.items():
+            seen = set()
+            for depth, func in enumerate(stack):
+                leaf_seconds = seconds if depth == len(stack) - 1 else 0.0
+                entry = stats.setdefault(func, [0, 0, 0.0, 0.0, {}])
+                entry[2] += leaf_seconds
+                if func not in seen:  # recursive frames count once per sample
+                    seen.add(func)
+                    entry[0] += n
+                    entry[1] += n
+                    entry[3] += seconds
+                if depth:
+                    edge = entry[4].setdefault(stack[depth - 1], [0, 0, 0.0, 0.0])
+                    edge[0] += n
+                    edge[1] += n
+                    edge[2] += leaf_seconds
+                    edge[3] += seconds
+        self.stats = {
+            func: (cc, nc, tt, ct, {caller: tuple(edge) for caller, edge in callers.items()})
+            for func, (cc, nc, tt, ct, callers) in stats.items()
+        }
+
+    def dump_stats(self, path: str):
+        self.create_stats()
+        with open(path, "wb") as f:
+            marshal.dump(self.stats, f)
+
+
+class ProfileRing:
+    """Bounded on-disk ring of request profiles."""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str, max_entries: int = 100):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # One capture at a time keeps the overhead bounded (and 3.12+ allows
+        # only one active cProfile per process); a busy profiler just skips.
+        self._profiler_busy = threading.Lock()
+        self._index = self._load_index()  # directory is created on first save
+
+    # ---------------- index helpers ----------------
+    def _index_path(self):
+        return os.path.join(self.directory, self.INDEX_FILE)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def _save_index(self):
+        tmp = self._index_path() + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self._index_path())
+
+    def _prof_path(self, entry_id: str):
+        return os.path.join(self.directory, f"{entry_id}.prof")
+
+    # ---------------- capture ----------------
+    @contextmanager
+    def capture(self, label: str, meta: dict = None):
+        """Profile the body of the `with` block (skipped if another capture is running)."""
+        if not self._profiler_busy.acquire(blocking=False):
+            yield None
+            return
+
+        if CPROFILE_IS_PER_THREAD:
+            profiler, kind = cProfile.Profile(), "cprofile"
+        else:
+            # Frames below the one running the `with` block (capture ->
+            # contextlib __enter__ -> caller) are the server's, not the request's.
+            profiler, kind = ThreadSampler(outer_frame=sys._getframe(2).f_back), "sampled"
+        start = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                yield profiler
+            finally:
+                profiler.disable()
+                duration_ms = (time.perf_counter() - start) * 1000
+                self._store(profiler, kind, label, meta or {}, duration_ms)
+        finally:
+            self._profiler_busy.release()
+
+    def _store(self, profiler, kind: str, label: str, meta: dict, duration_ms: float):
+        entry = {
+            "id": uuid.uuid4().hex[:12],
+            "label": label,
+            "profiler": kind,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "duration_ms": round(duration_ms, 2),
+            **meta,
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        profiler.dump_stats(self._prof_path(entry["id"]))
+
+        with self._lock:
+            self._index.append(entry)
+            while len(self._index) > self.max_entries:
+                old = self._index.pop(0)
+                try:
+                    os.remove(self._prof_path(old["id"]))
+                except OSError:
+                    pass
+            self._save_index()
+
+    # ---------------- reading ----------------
+    def slowest(self, limit: int = 50):
+        """Captured entries, slowest first."""
+        with self._lock:
+            entries = list(self._index)
+        entries.sort(key=lambda e: e["duration_ms"], reverse=True)
+        return entries[:limit]
+
+    def report(self, entry_id: str, sort: str = "cumulative", limit: int = 40):
+        """Text pstats report for one capture, or None if it no longer exists."""
+        with self._lock:
+            entry = next((e for e in self._index if e["id"] == entry_id), None)
+        if entry is None:
+            return None
+
+        out = io.StringIO()
+        if entry.get("profiler") == "sampled":
+            out.write("Sampled profile of the request thread "
+                      "(ncalls = samples, times = wall-clock seconds)\n")
+        try:
+            stats = pstats.Stats(self._prof_path(entry_id), stream=out)
+        except (OSError, EOFError, ValueError):
+            # .prof gone (stale index, or rotated out since the lookup) or truncated
+            return None
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
@@ -0,0 +1,285 @@
+"""
+replay.py  –  deterministic offline replay of captured /chat traffic
+
+Step 1: run a capture log (CHATBOT_CAPTURE_SAMPLE_RATE, see app.py) through
+each build, offline, with the translator stand-in:
+
+    python replay.py run captures/traffic.jsonl --out results_old.jsonl
+    (check out the other build)
+    python replay.py run captures/traffic.jsonl --out results_new.jsonl
+
+    --mode chat  feeds each record through app.chat() (full pipeline)
+    --mode bot   calls CollegeChatbot.get_reply() only (model + matching)
+
+Each tenant's answer cache is cleared before every record so latencies
+measure the code rather than cache hits (--keep-cache to keep it warm).
+Records for a tenant that this build doesn't have are written with the
+decision "missing_tenant" and no latency.
+
+Step 2: compare the two result files:
+
+    python replay.py diff results_old.jsonl results_new.jsonl
+
+The diff report shows latency distributions (total and per stage) for both
+builds and every request whose answer / clarify decision changed.
+"""
+
+import argparse
+import hashlib
+import json
+import statistics
+import sys
+import time
+
+from chatbot.traffic_capture import read_capture
+from loadtest import percentile
+
+
+# ================================================================
+#                              RUN
+# ================================================================
+
+def _reply_digest(text: str) -> str:
+    return hashlib.sha1((text or "").encode("utf-8")).hexdigest()[:12]
+
+
+def _load_app(translator_latency_ms: float):
+    import app as chat_app
+    from offline_translator import install
+
+    install(chat_app, latency_ms=translator_latency_ms)
+    # Replays must be deterministic and must not feed back into captures
+    chat_app.PROFILE_SAMPLE_RATE = 0
+    chat_app.traffic_recorder.sample_rate = 0
+    return chat_app
+
+
+def _resolve_tenant(chat_app, record: dict):
+    """The record's tenant, loaded (outside any timing); None if unknown here."""
+    tenant_id = record.get("tenant") or chat_app.DEFAULT_TENANT
+    if not isinstance(tenant_id, str):
+        return None
+    try:
+        return chat_app.tenants.get(tenant_id.strip().lower())
+    except KeyError:
+        return None
+
+
+def _missing_tenant_result() -> dict:
+    return {
+        "latency_ms": None,
+        "stages": {},
+        "status": 404,
+        "decision": "missing_tenant",
+        "options": [],
+        "reply": "",
+    }
+
+
+def replay_chat(chat_app, record: dict) -> dict:
+    """Send one captured payload through app.chat() and describe the outcome."""
+    from flask import g
+
+    payload = {
+        "message": record.get("message", ""),
+        "topic": record.get("topic", ""),
+        "lang": record.get("lang", ""),
+        "tenant": record.get("tenant", ""),
+    }
+    with chat_app.app.test_request_context("/chat", method="POST", json=payload):
+        start = time.perf_counter()
+        response = chat_app.app.make_response(chat_app.chat())
+        latency_ms = (time.perf_counter() - start) * 1000
+        stages = g.stage_timer.as_dict()
+
+    body = response.get_json(silent=True) or {}
+    if body.get("clarify"):
+        decision = "clarify:" + (body.get("clarify_topic") or "")
+    else:
+        decision = "answer"
+
+    return {
+        "latency_ms": round(latency_ms, 3),
+        "stages": stages,
+        "status": response.status_code,
+        "decision": decision,
+        "options": [opt.get("number") for opt in body.get("options") or []],
+        "reply": _reply_digest(body.get("reply")),
+    }
+
+
+def replay_bot(chat_app, record: dict) -> dict:
+    """Call CollegeChatbot.get_reply() directly for one captured message."""
+    tenant = _resolve_tenant(chat_app, record)
+
+    start = time.perf_counter()
+    result = tenant.bot.get_reply(record.get("message", ""))
+    latency_ms = (time.perf_counter() - start) * 1000
+
+    if result["type"] == "clarify":
+        decision = "clarify:faq"
+        options = [opt["index"] for opt in result["options"]]
+        reply = ""
+    else:
+        decision = "answer"
+        options = [result.get("index")]
+        reply = result["text"]
+
+    return {
+        "latency_ms": round(latency_ms, 3),
+        "stages": {},
+        "status": 200,
+        "decision": decision,
+        "options": options,
+        "reply": _reply_digest(reply),
+    }
+
+
+def run(capture_path: str, out_path: str, mode: str, translator_latency_ms: float,
+        limit: int = 0, keep_cache: bool = False):
+    chat_app = _load_app(translator_latency_ms)
+    replay_one = replay_chat if mode == "chat" else replay_bot
+
+    count = 0
+    with open(out_path, "w", encoding="utf-8") as out:
+        for i, record in enumerate(read_capture(capture_path)):
+            if limit and i >= limit:
+                break
+            tenant = _resolve_tenant(chat_app, record)
+            if tenant is None:
+                outcome = _missing_tenant_result()
+            else:
+                if not keep_cache:
+                    tenant.answer_cache.clear()
+                outcome = replay_one(chat_app, record)
+            result = {"i": i, "message": record.get("message", ""), **outcome}
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+
+    print(f"Replayed {count} requests ({mode} mode) → {out_path}")
+
+
+# ================================================================
+#                              DIFF
+# ================================================================
+
+def _distribution(values) -> dict:
+    values = sorted(values)
+    if not values:
+        return {"n": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "n": len(values),
+        "mean": round(statistics.fmean(values), 2),
+        "p50": round(percentile(values, 50), 2),
+        "p90": round(percentile(values, 90), 2),
+        "p99": round(percentile(values, 99), 2),
+        "max": round(values[-1], 2),
+    }
+
+
+def _load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return {r["i"]: r for r in (json.loads(line) for line in f if line.strip())}
+
+
+def diff(path_a: str, path_b: str, show: int = 20) -> dict:
+    a, b = _load_results(path_a), _load_results(path_b)
+    common = sorted(set(a) & set(b))
+    # Latency only where both builds actually ran the request
+    timed = [i for i in common
+             if a[i]["latency_ms"] is not None and b[i]["latency_ms"] is not None]
+
+    # Latency: total and per stage
+    stage_names = sorted({s for r in list(a.values()) + list(b.values()) for s in r["stages"]})
+    latency = {"total": (
+        _distribution([a[i]["latency_ms"] for i in timed]),
+        _distribution([b[i]["latency_ms"] for i in timed]),
+    )}
+    for stage in stage_names:
+        latency[stage] = (
+            _distribution([a[i]["stages"].get(stage, 0.0) for i in timed]),
+            _distribution([b[i]["stages"].get(stage, 0.0) for i in timed]),
+        )
+
+    missing_a = sum(1 for i in common if a[i]["decision"] == "missing_tenant")
+    missing_b = sum(1 for i in common if b[i]["decision"] == "missing_tenant")
+
+    # Decisions: answer vs clarify, chosen options, reply text
+    changed = []
+    for i in common:
+        ra, rb = a[i], b[i]
+        if (ra["decision"], ra["options"], ra["reply"]) != (rb["decision"], rb["options"], rb["reply"]):
+            changed.append((i, ra, rb))
+
+    print(f"A: {path_a}\nB: {path_b}\nCompared {len(common)} requests "
+          f"(only in A: {len(set(a) - set(b))}, only in B: {len(set(b) - set(a))})")
+    print(f"Tenant not configured: {missing_a} in A, {missing_b} in B "
+          f"(excluded from latency; {len(timed)} requests timed)\n")
+
+    print(f"{'latency (ms)':<16}{'':>4}{'mean':>9}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}")
+    for name, (da, db) in latency.items():
+        for label, d in (("A", da), ("B", db)):
+            print(f"{name if label == 'A' else '':<16}{label:>4}"
+                  f"{d['mean']:>9}{d['p50']:>9}{d['p90']:>9}{d['p99']:>9}{d['max']:>9}")
+        if da["p50"]:
+            print(f"{'':<16}{'Δ':>4}{'':>9}{(db['p50'] - da['p50']) / da['p50']:>+9.1%}")
+
+    decision_changes = sum(1 for _, ra, rb in changed if ra["decision"] != rb["decision"])
+    print(f"\nChanged outcomes: {len(changed)}  "
+          f"(decision changed: {decision_changes}, same decision but different "
+          f"options/reply: {len(changed) - decision_changes})")
+    for i, ra, rb in changed[:show]:
+        print(f"  #{i} {ra['message'][:60]!r}: {ra['decision']} {ra['options']} "
+              f"→ {rb['decision']} {rb['options']}")
+    if len(changed) > show:
+        print(f"  ... and {len(changed) - show} more")
+
+    return {
+        "compared": len(common),
+        "timed": len(timed),
+        "missing_tenant": {"a": missing_a, "b": missing_b},
+        "latency": latency,
+        "changed": [i for i, _, _ in changed],
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Replay captured /chat traffic and compare builds")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="replay a capture log through this build")
+    p_run.add_argument("capture", help="capture log written by app.py")
+    p_run.add_argument("--out", required=True, help="JSONL results file to write")
+    p_run.add_argument("--mode", choices=["chat", "bot"], default="chat",
+                       help="full chat() pipeline or CollegeChatbot.get_reply only")
+    p_run.add_argument("--translator-latency", type=float, default=0.0,
+                       help="simulated translator round trip in ms")
+    p_run.add_argument("--limit", type=int, default=0, help="replay only the first N records")
+    p_run.add_argument("--keep-cache", action="store_true",
+                       help="keep answer caches warm between records (default: clear before each)")
+
+    p_diff = sub.add_parser("diff", help="compare two result files")
+    p_diff.add_argument("a", help="results of the baseline build")
+    p_diff.add_argument("b", help="results of the candidate build")
+    p_diff.add_argument("--show", type=int, default=20, help="changed requests to list")
+    p_diff.add_argument("--json", metavar="FILE", help="also write the report as JSON")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "run":
+        run(args.capture, args.out, args.mode, args.translator_latency, args.limit,
+            args.keep_cache)
+        return 0
+
+    report = diff(args.a, args.b, args.show)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
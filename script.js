@@ -18,6 +18,9 @@ const largeTextToggle = document.getElementById("large-text-toggle");
 const contrastToggle = document.getElementById("contrast-toggle");
 const languageSelect = document.getElementById("language-select");
 
+/* College/campus this page belongs to (set by the server) */
+const tenantId = document.body.dataset.tenant || "";
+
 /* Clarification topic: "courses", "fee", or null */
 let activeClarifyTopic = null;
 
@@ -27,9 +30,45 @@ if (languageSelect) {
     selectedLanguage = languageSelect.value;
     languageSelect.addEventListener("change", () => {
         selectedLanguage = languageSelect.value || "";
+        prefetchBootstrap(selectedLanguage);
     });
 }
 
+/* ==========================
+   STATIC MENUS (BOOTSTRAP)
+========================== */
+
+/* Course/fee menus + answers per language, fetched once from /bootstrap
+   so option clicks can be answered without a round trip */
+const bootstrapVersion = document.body.dataset.bootstrapVersion || "";
+const bootstrapData = {};
+
+async function prefetchBootstrap(lang) {
+    const key = lang || "";
+    if (bootstrapData[key]) return;
+
+    try {
+        const res = await fetch(
+            `/bootstrap?lang=${encodeURIComponent(key)}&v=${encodeURIComponent(bootstrapVersion)}` +
+                `&tenant=${encodeURIComponent(tenantId)}`
+        );
+        if (!res.ok) return;
+        const data = await res.json();
+        /* server falls back to English if translation failed; try again later */
+        if ((data.lang || "") === key) bootstrapData[key] = data;
+    } catch (err) {
+        console.error(err);
+    }
+}
+
+function localMenuAnswer(topic, number) {
+    const data = bootstrapData[selectedLanguage || ""];
+    if (!data || !topic || !data.menus[topic]) return null;
+    return data.menus[topic].answers[String(number)] || null;
+}
+
+prefetchBootstrap(selectedLanguage);
+
 /* ==========================
       CHAT FUNCTIONS
 ========================== */
@@ -73,7 +112,15 @@ function renderOptions(options) {
             <span>${opt.question}</span>
         `;
         card.addEventListener("click", () => {
-            sendMessage(String(opt.number));
+            const local = localMenuAnswer(activeClarifyTopic, opt.number);
+            if (local) {
+                /* static course/fee answer: no server round trip */
+                addMessage(String(opt.number), "user");
+                addMessage(local, "bot");
+                activeClarifyTopic = null;
+            } else {
+                sendMessage(String(opt.number));
+            }
             clearOptions();
         });
         optionsContainer.appendChild(card);
@@ -101,6 +148,7 @@ async function sendMessage(text) {
                 message: clean,
                 topic: activeClarifyTopic || "",
                 lang: selectedLanguage || "",
+                tenant: tenantId,
             }),
         });
 
@@ -0,0 +1,276 @@
+"""
+Multi-tenant FAQ corpora (several colleges / campuses in one deployment).
+
+Every tenant has its own FAQ file and static course/fee tables, but all
+tenants share ONE SentenceTransformer encoder. A tenant's embedding index
+and answers are loaded on first use, and idle tenants are evicted (least
+recently used first) when the estimated memory goes over the budget.
+
+data/tenants.json:
+    {
+        "dsu":    {"faq_path": "data/faq_data.json"},
+        "campus2": {"faq_path": "data/campus2_faq.bin",
+                    "static_path": "data/campus2_static.json"}
+    }
+
+A static file may contain any of: course_menu_prompt, course_school_options,
+course_school_answers, fee_menu_prompt, fee_options, fee_answers. Missing
+tables fall back to the defaults passed to TenantRegistry.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from chatbot.admission import AnswerCache
+from chatbot.model import CollegeChatbot, MODEL_NAME
+
+# After a failed background load the tenant is not retried for this long;
+# the wait doubles with each consecutive failure, up to the maximum.
+LOAD_RETRY_BACKOFF_S = 5
+LOAD_RETRY_BACKOFF_MAX_S = 300
+
+
+class TenantUnavailable(Exception):
+    """The tenant's last load failed; it is retried after `retry_after` seconds."""
+
+    def __init__(self, tenant_id: str, error: str, retry_after: float):
+        super().__init__(f"{tenant_id}: {error}")
+        self.tenant_id = tenant_id
+        self.error = error
+        self.retry_after = retry_after
+
+
+def load_tenant_configs(path: str, default_tenant: str, default_faq_path: str) -> dict:
+    """Read tenants.json; without it there is a single default tenant."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            configs = json.load(f)
+    except FileNotFoundError:
+        configs = {}
+
+    configs = {tid.strip().lower(): cfg for tid, cfg in configs.items()}
+    configs.setdefault(default_tenant, {"faq_path": default_faq_path})
+    return configs
+
+
+class Tenant:
+    """One college/campus: its chatbot index plus static menu tables."""
+
+    def __init__(self, tenant_id: str, bot: CollegeChatbot, tables: dict):
+        self.id = tenant_id
+        self.bot = bot
+
+        self.course_menu_prompt = tables["course_menu_prompt"]
+        self.course_school_options = tables["course_school_options"]
+        self.course_school_answers = {int(k): v for k, v in tables["course_school_answers"].items()}
+        self.fee_menu_prompt = tables["fee_menu_prompt"]
+        self.fee_options = tables["fee_options"]
+        self.fee_answers = {int(k): v for k, v in tables["fee_answers"].items()}
+
+        # Per-tenant caches (answers must never leak between colleges)
+        self.answer_cache = AnswerCache(maxsize=512)
+        self.bootstrap_cache = {}
+        self.bootstrap_version = hashlib.sha1(
+            json.dumps(self.static_menus(), sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:12]
+
+    def static_menus(self) -> dict:
+        return {
+            "courses": {
+                "prompt": self.course_menu_prompt,
+                "options": self.course_school_options,
+                "answers": self.course_school_answers,
+            },
+            "fee": {
+                "prompt": self.fee_menu_prompt,
+                "options": self.fee_options,
+                "answers": self.fee_answers,
+            },
+        }
+
+    def memory_bytes(self) -> int:
+        """Rough size of what this tenant keeps in memory (shared encoder excluded)."""
+        size = self.bot.question_embeddings.nbytes
+        size += sum(sys.getsizeof(q) for q in self.bot.questions_lower)
+        if self.bot.store is None:
+            # JSON-loaded; a packed store is mmapped and paged in by the OS
+            size += sum(sys.getsizeof(q) for q in self.bot.questions)
+            size += sum(sys.getsizeof(a) for a in self.bot.answers)
+        size += sum(sys.getsizeof(a) for a in self.course_school_answers.values())
+        size += sum(sys.getsizeof(a) for a in self.fee_answers.values())
+        return size
+
+
+class TenantRegistry:
+    """
+    Lazily loads tenants with a shared encoder and evicts idle ones by LRU.
+
+    - get(tenant_id) loads on first use in the calling thread (startup,
+      offline tools); raises KeyError for unknown ids
+    - get_nowait(tenant_id) never blocks: it returns None and loads the
+      tenant in the background, so request threads don't queue behind a
+      corpus being encoded. After a failed load it raises TenantUnavailable
+      until the retry backoff has passed
+    - load_slot, if given, is a context manager factory that blocks until
+      a slot is free (e.g. AdmissionGate.background_slot); background loads
+      hold one so encoding counts against the same concurrency limit as
+      inference
+    - pinned tenants (e.g. the default college) are never evicted
+    """
+
+    def __init__(self, configs: dict, default_tables: dict, memory_budget_bytes: int,
+                 pinned=(), encoder_factory=None, load_slot=None):
+        self.configs = configs
+        self.default_tables = default_tables
+        self.memory_budget_bytes = memory_budget_bytes
+        self.pinned = set(pinned)
+        self._encoder_factory = encoder_factory or self._default_encoder
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+
+        self._lock = threading.Lock()
+        self._loaded = OrderedDict()   # tenant_id -> Tenant, least recent first
+        self._sizes = {}
+        self._load_locks = {}
+        self._load_slot = load_slot
+        self._loading = set()
+        self._failures = {}   # tenant_id -> (consecutive failed loads, monotonic time of last)
+        self.load_errors = {}
+        self.loads = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _default_encoder():
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(MODEL_NAME)
+
+    @property
+    def encoder(self):
+        with self._encoder_lock:
+            if self._encoder is None:
+                self._encoder = self._encoder_factory()
+            return self._encoder
+
+    def get(self, tenant_id: str) -> Tenant:
+        with self._lock:
+            if tenant_id in self._loaded:
+                self._loaded.move_to_end(tenant_id)
+                return self._loaded[tenant_id]
+            if tenant_id not in self.configs:
+                raise KeyError(tenant_id)
+        return self._load_and_register(tenant_id)
+
+    def get_nowait(self, tenant_id: str):
+        """Loaded tenant, or None while it loads in the background."""
+        with self._lock:
+            if tenant_id in self._loaded:
+                self._loaded.move_to_end(tenant_id)
+                return self._loaded[tenant_id]
+            if tenant_id not in self.configs:
+                raise KeyError(tenant_id)
+            if tenant_id in self._loading:
+                return None
+            retry_after = self._retry_after(tenant_id)
+            if retry_after > 0:
+                raise TenantUnavailable(tenant_id, self.load_errors[tenant_id], retry_after)
+            self._loading.add(tenant_id)
+
+        threading.Thread(
+            target=self._load_in_background, args=(tenant_id,), daemon=True
+        ).start()
+        return None
+
+    def _retry_after(self, tenant_id: str) -> float:
+        """Seconds until a failed tenant may be loaded again (lock held)."""
+        if tenant_id not in self._failures:
+            return 0.0
+        failures, failed_at = self._failures[tenant_id]
+        backoff = min(LOAD_RETRY_BACKOFF_S * 2 ** (failures - 1), LOAD_RETRY_BACKOFF_MAX_S)
+        return max(0.0, failed_at + backoff - time.monotonic())
+
+    def _load_in_background(self, tenant_id: str):
+        try:
+            if self._load_slot is None:
+                self._load_and_register(tenant_id)
+            else:
+                with self._load_slot():
+                    self._load_and_register(tenant_id)
+        except Exception as exc:
+            # Retried by the first request after the backoff
+            with self._lock:
+                self.load_errors[tenant_id] = repr(exc)
+                failures = self._failures.get(tenant_id, (0, 0.0))[0] + 1
+                self._failures[tenant_id] = (failures, time.monotonic())
+        finally:
+            with self._lock:
+                self._loading.discard(tenant_id)
+
+    def _load_and_register(self, tenant_id: str) -> Tenant:
+        with self._lock:
+            load_lock = self._load_locks.setdefault(tenant_id, threading.Lock())
+
+        # Only one thread loads a given tenant; others wait for it
+        with load_lock:
+            with self._lock:
+                if tenant_id in self._loaded:
+                    self._loaded.move_to_end(tenant_id)
+                    return self._loaded[tenant_id]
+
+            tenant = self._load(tenant_id)
+
+            with self._lock:
+                self._loaded[tenant_id] = tenant
+                self._sizes[tenant_id] = tenant.memory_bytes()
+                self.load_errors.pop(tenant_id, None)
+                self._failures.pop(tenant_id, None)
+                self.loads += 1
+                self._evict(keep=tenant_id)
+            return tenant
+
+    def _load(self, tenant_id: str) -> Tenant:
+        cfg = self.configs[tenant_id]
+        tables = dict(self.default_tables)
+        if cfg.get("static_path"):
+            with open(cfg["static_path"], "r", encoding="utf-8") as f:
+                tables.update(json.load(f))
+
+        bot = CollegeChatbot(cfg["faq_path"], model=self.encoder)
+        return Tenant(tenant_id, bot, tables)
+
+    def _evict(self, keep: str):
+        """Drop least recently used tenants until under budget (lock held)."""
+        for tenant_id in list(self._loaded):
+            if sum(self._sizes.values()) <= self.memory_budget_bytes:
+                break
+            if tenant_id == keep or tenant_id in self.pinned:
+                continue
+            # In-flight requests may still hold the tenant; it is freed
+            # (and any mmap closed) once they are done with it.
+            self._loaded.pop(tenant_id)
+            self._sizes.pop(tenant_id)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "configured": sorted(self.configs),
+                "loaded": list(self._loaded),
+                "loading": sorted(self._loading),
+                "load_errors": dict(self.load_errors),
+                "load_retry_in_s": {
+                    tenant_id: round(self._retry_after(tenant_id), 1)
+                    for tenant_id in self._failures
+                },
+                "memory_bytes": sum(self._sizes.values()),
+                "answer_cache_sizes": {
+                    tenant_id: len(tenant.answer_cache)
+                    for tenant_id, tenant in self._loaded.items()
+                },
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "loads": self.loads,
+                "evictions": self.evictions,
+            }
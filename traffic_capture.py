@@ -0,0 +1,85 @@
+"""
+Sampled capture of production /chat traffic.
+
+StageTimer adds up wall time per pipeline stage (translate_in, intent,
+match, translate_out, ...) for one request. TrafficRecorder appends a
+compact JSON line per sampled request to a size-bounded log:
+
+    {"ts": ..., "tenant": "dsu", "message": "...", "topic": "", "lang": "kn",
+     "total_ms": 182.4, "stages": {"translate_in": 0.1, "match": 41.0, ...},
+     "status": 200, "clarify": false, "clarify_topic": ""}
+
+The log is the input of replay.py, which feeds it back through chat()
+offline to compare builds.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """Accumulated milliseconds per named stage."""
+
+    def __init__(self):
+        self.stages = defaultdict(float)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] += (time.perf_counter() - start) * 1000
+
+    def as_dict(self) -> dict:
+        return {name: round(ms, 3) for name, ms in self.stages.items()}
+
+
+class TrafficRecorder:
+    """
+    Appends sampled request records to a JSONL file. When the file grows
+    past `max_bytes` it is rotated to `<path>.1` (one old file is kept).
+    """
+
+    def __init__(self, path: str, sample_rate: float = 0.0, max_bytes: int = 50 * 1024 * 1024):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def should_sample(self) -> bool:
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def record(self, entry: dict):
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            try:
+                if os.path.getsize(self.path) + len(line) > self.max_bytes:
+                    os.replace(self.path, self.path + ".1")
+            except OSError:
+                pass
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self.recorded += 1
+
+
+def read_capture(path: str):
+    """Yield captured records one at a time (skips malformed lines)."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue